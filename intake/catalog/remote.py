@@ -6,28 +6,112 @@
 #-----------------------------------------------------------------------------
 
 import collections
-import copy
+from concurrent.futures import ThreadPoolExecutor
 import keyword
 import logging
 import posixpath
-import re
+import time
 import warnings
 
 import msgpack
 
-from ..source import registry as plugin_registry
+from ..source import registry as plugin_registry, _registry
 from . import Catalog
 from .entry import CatalogEntry
 from .utils import expand_defaults, coerce, RemoteCatalogError
 from ..compat import unpack_kwargs, pack_kwargs
-from ..utils import remake_instance
+from ..utils import remake_instance, decode_datetime, FastDumper
 from intake.auth.base import BaseClientAuth, AuthenticationFailure
 logger = logging.getLogger('intake')
+_MISSING = object()
+# Names in the driver registry, and the registry version they were taken at
+_cached_plugin_names = None
+_cached_plugin_version = -1
+
+try:
+    import msgspec
+    _MP_DEC = msgspec.msgpack.Decoder()
+except ImportError:
+    _MP_DEC = None
+
+
+def _unpack(data):
+    """Decode a msgpack message from the server
+
+    Uses msgspec if it is installed, which is considerably faster than
+    msgpack-python for large catalog listings. msgspec has no equivalent of
+    ``object_hook``, so datetimes (sent as tagged maps, see
+    ``intake.utils.encode_datetime``) are converted in a second pass, which is
+    only made if the message contains any.
+    """
+    if _MP_DEC is None:
+        return msgpack.unpackb(data, **unpack_kwargs)
+    out = _MP_DEC.decode(data)
+    if b'__datetime__' in data:
+        out = _decode_datetimes(out)
+    return out
+
+
+def _read_body(response):
+    """Read the whole body of a response requested with ``stream=True``
+
+    The body is read from the socket in one call and handed straight to the
+    decoder, rather than going through ``response.content``, which collects
+    it in small chunks and then joins them into a second copy.
+    """
+    return response.raw.read(decode_content=True)
+
+
+def _get_cached_plugin_names():
+    """List of the installed driver names, sent to the server on open
+
+    Rebuilt only when drivers have been registered or removed since the last
+    call.
+    """
+    global _cached_plugin_names, _cached_plugin_version
+    version = _registry.version
+    if version != _cached_plugin_version:
+        _cached_plugin_names = list(plugin_registry)
+        _cached_plugin_version = version
+    return _cached_plugin_names
+
+
+def _check_status(response, msg):
+    """Raise RemoteCatalogError(msg) if the response has an error status
+
+    The status code is tested directly, so that nothing is raised and caught
+    on success; on failure, the underlying HTTPError is chained as the cause.
+    """
+    if response.status_code >= 400:
+        import requests
+        # Read the body, so that the connection goes back to the pool.
+        _read_body(response)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as err:
+            raise RemoteCatalogError(msg) from err
+
+
+def _decode_datetimes(obj):
+    # Apply decode_datetime to every map, innermost first, as msgpack does
+    # with object_hook.
+    if isinstance(obj, dict):
+        return decode_datetime({k: _decode_datetimes(v)
+                                for k, v in obj.items()})
+    if isinstance(obj, list):
+        return [_decode_datetimes(v) for v in obj]
+    return obj
 
 
 class RemoteCatalog(Catalog):
     """The state of a remote Intake server"""
     name = 'intake_remote'
+    # Number of page requests kept in flight while iterating a paginated
+    # catalog.
+    _prefetch = 4
+    # Number of asearch() queries run at once; kept below the connection
+    # pool size.
+    _search_workers = 4
 
     def __init__(self, url, http_args=None, page_size=None,
                  name=None, source_id=None, metadata=None, auth=None, ttl=1,
@@ -69,12 +153,16 @@ class RemoteCatalog(Catalog):
         parameters: dict
             To pass to the server when it instantiates the data source
         """
+        import requests
+        from requests.adapters import HTTPAdapter
         from requests.compat import urljoin, urlparse
         if http_args is None:
             http_args = {}
         else:
-            # Make a deep copy to avoid mutating input.
-            http_args = copy.deepcopy(http_args)
+            # Copy to avoid mutating input. Only the top level and the
+            # headers are ever modified, so there is no need to deep-copy.
+            http_args = {**http_args,
+                         'headers': {**http_args.get('headers', {})}}
         secure = http_args.pop('ssl', False)
         scheme = 'https' if secure else 'http'
         url = url.replace('intake', scheme, 1)
@@ -91,6 +179,19 @@ class RemoteCatalog(Catalog):
         self._parameters = parameters
         self._len = None
         self.auth = auth or BaseClientAuth()
+        # Cached result of _rebuild_base_http_args, and when it was made
+        self._base_http_args = None
+        self._base_http_args_ts = 0
+        # One session for all calls to this server, so that connections are
+        # pooled and kept alive rather than re-established per request.
+        self._session = requests.Session()
+        self._session.mount(scheme + '://', HTTPAdapter(pool_connections=20,
+                                                        pool_maxsize=20))
+        # Runs asearch() queries; created on first use
+        self._executor = None
+        # Whether the server supports fetching several entries in one request;
+        # set to False on the first refusal.
+        self._batch_lookup = True
 
         if self._source_id is None:
             name = urlparse(url).netloc.replace(
@@ -106,7 +207,7 @@ class RemoteCatalog(Catalog):
         # Include (cached) tab-completable entries and normal attributes.
         return (
             [key for key in self._ipython_key_completions_() if
-             re.match("[_A-Za-z][_a-zA-Z0-9]*$", key)  # valid Python identifier
+             key.isidentifier()  # valid Python identifier
              and not keyword.iskeyword(key)]  # not a Python keyword
             + list(self.__dict__.keys()))
 
@@ -129,68 +230,108 @@ class RemoteCatalog(Catalog):
         return self._page_size
 
     def fetch_page(self, page_offset):
-        import requests
-        logger.debug("Request page entries %d-%d",
-                     page_offset, page_offset + self._page_size)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request page entries %d-%d",
+                         page_offset, page_offset + self._page_size)
         params = {'page_offset': page_offset,
                   'page_size': self._page_size}
         http_args = self._get_http_args(params)
-        response = requests.get(self.info_url, **http_args)
-        # Produce a chained exception with both the underlying HTTPError
-        # and our own more direct context.
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as err:
-            raise RemoteCatalogError(
-                "Failed to fetch page of entries {}-{}."
-                "".format(page_offset, page_offset + self._page_size)) from err
-        info = msgpack.unpackb(response.content, **unpack_kwargs)
-        page = {}
-        for source in info['sources']:
-            user_parameters = source.get('user_parameters', [])
-            # TODO Do something with self._parameters.
-            page[source['name']] = RemoteCatalogEntry(
-                url=self.url,
-                getenv=self.getenv,
-                getshell=self.getshell,
-                auth=self.auth,
-                http_args=self.http_args,
-                page_size=self._page_size,
-                persist_mode=self.pmode,
-                # user_parameters=user_parameters,
-                **source)
-        return page
+        response = self._session.get(self.info_url, stream=True,
+                                     **http_args)
+        _check_status(response, "Failed to fetch page of entries {}-{}."
+                      "".format(page_offset, page_offset + self._page_size))
+        info = _unpack(_read_body(response))
+        # TODO Do something with self._parameters.
+        return self._make_entries(info['sources'])
 
     def fetch_by_name(self, name):
-        import requests
-        logger.debug("Requesting info about entry named '%s'", name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Requesting info about entry named '%s'", name)
         params = {'name': name}
         http_args = self._get_http_args(params)
-        response = requests.get(self.source_url, **http_args)
+        response = self._session.get(self.source_url, stream=True,
+                                     **http_args)
         if response.status_code == 404:
+            _read_body(response)
             raise KeyError(name)
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as err:
-            raise RemoteCatalogError(
-                "Failed to fetch entry {!r}.".format(name)) from err
-        info = msgpack.unpackb(response.content, **unpack_kwargs)
-        return RemoteCatalogEntry(
-            url=self.url,
-            getenv=self.getenv,
-            getshell=self.getshell,
-            auth=self.auth,
-            http_args=self.http_args,
-            page_size=self._page_size,
-            persist_mode=self.pmode,
-            **info['source'])
+        _check_status(response, "Failed to fetch entry {!r}.".format(name))
+        info = _unpack(_read_body(response))
+        entry = RemoteCatalogEntry(**self._entry_kwargs(), **info['source'])
+        entry._session = self._session
+        return entry
+
+    def fetch_by_names(self, names):
+        """Fetch several entries by name, in a single request if possible
+
+        Returns a dict of name: entry for those of ``names`` that exist. For
+        servers that do not support batch lookup, falls back to one request
+        per name.
+        """
+        if self._batch_lookup:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Requesting info about entries named %s", names)
+            request = {'action': 'get_many', 'names': list(names)}
+            response = self._session.post(
+                url=self.source_url, stream=True, **self._get_http_args({}),
+                data=msgpack.packb(request, **pack_kwargs))
+            if response.status_code == 400:
+                # The server predates the 'get_many' action.
+                self._batch_lookup = False
+                _read_body(response)
+            else:
+                _check_status(response,
+                              "Failed to fetch entries {!r}.".format(names))
+                info = _unpack(_read_body(response))
+                return self._make_entries(info['sources'])
+        entries = {}
+        for name in names:
+            try:
+                entries[name] = self.fetch_by_name(name)
+            except KeyError:
+                pass
+        return entries
+
+    def _make_entries(self, sources):
+        """Make a dict of name: entry from source descriptions"""
+        shared = self._entry_kwargs()
+        entries = {source['name']: RemoteCatalogEntry(**shared, **source)
+                   for source in sources}
+        for entry in entries.values():
+            entry._session = self._session
+        return entries
+
+    def _entry_kwargs(self):
+        """Keyword arguments shared by all entries fetched from this catalog"""
+        return dict(url=self.url,
+                    getenv=self.getenv,
+                    getshell=self.getshell,
+                    auth=self.auth,
+                    http_args=self.http_args,
+                    page_size=self._page_size,
+                    persist_mode=self.pmode)
 
     def _get_http_args(self, params):
         """
         Return a copy of the http_args
 
-        Adds auth headers and 'source-id', merges in params.
+        Adds auth headers and 'source-id', merges in params. The headers are
+        assembled at most once per ``ttl`` seconds (and on every reload),
+        since only the params differ between successive calls.
         """
+        if (self._base_http_args is None or
+                time.time() - self._base_http_args_ts > self.ttl):
+            self._rebuild_base_http_args()
+        http_args = self._base_http_args.copy()
+
+        # Merge in any params specified by the caller. Copy, since pages may
+        # be requested concurrently with different params.
+        merged_params = dict(http_args.get('params', {}))
+        merged_params.update(params)
+        http_args['params'] = merged_params
+        return http_args
+
+    def _rebuild_base_http_args(self):
+        """Assemble the http_args common to all calls, with auth headers"""
         # Add the auth headers to any other headers
         headers = self.http_args.get('headers', {})
         if self.auth is not None:
@@ -202,12 +343,8 @@ class RemoteCatalog(Catalog):
         if self._source_id is not None:
             headers['source-id'] = self._source_id
         http_args['headers'] = headers
-
-        # Merge in any params specified by the caller.
-        merged_params = http_args.get('params', {})
-        merged_params.update(params)
-        http_args['params'] = merged_params
-        return http_args
+        self._base_http_args = http_args
+        self._base_http_args_ts = time.time()
 
     def _load(self):
         """Fetch metadata from remote. Entries are fetched lazily."""
@@ -215,8 +352,9 @@ class RemoteCatalog(Catalog):
         # fetch sources from the server in paginated blocks when this Catalog
         # is iterated over. It will fetch specific sources when they are
         # accessed in this Catalog via __getitem__.
-        import requests
 
+        # Pick up any change to the auth headers.
+        self._base_http_args = None
         if self.page_size is None:
             # Fetch all source info.
             params = {}
@@ -224,19 +362,14 @@ class RemoteCatalog(Catalog):
             # Just fetch the metadata now; fetch source info later in pages.
             params = {'page_offset': 0, 'page_size': 0}
         http_args = self._get_http_args(params)
-        response = requests.get(self.info_url, **http_args)
-        try:
-            response.raise_for_status()
-            error = False
-        except requests.HTTPError as err:
-            if '403' in err.args[0]:
-                error = "Your current level of authentication does not have access"
-            else:
-                raise RemoteCatalogError(
-                    "Failed to fetch metadata.") from err
-        if error:
-            raise AuthenticationFailure(error)
-        info = msgpack.unpackb(response.content, **unpack_kwargs)
+        response = self._session.get(self.info_url, stream=True,
+                                     **http_args)
+        if response.status_code == 403:
+            _read_body(response)
+            raise AuthenticationFailure(
+                "Your current level of authentication does not have access")
+        _check_status(response, "Failed to fetch metadata.")
+        info = _unpack(_read_body(response))
         self.metadata = info['metadata']
         # The intake server now always provides a length, but the server may be
         # running an older version of intake.
@@ -251,26 +384,16 @@ class RemoteCatalog(Catalog):
             # Signal that we are not paginating, even if we were asked to.
             self._page_size = None
             self._entries._page_cache.update(
-                {source['name']: RemoteCatalogEntry(
-                    url=self.url,
-                    getenv=self.getenv,
-                    getshell=self.getshell,
-                    auth=self.auth,
-                    http_args=self.http_args, **source)
-                 for source in info['sources']})
+                self._make_entries(info['sources']))
 
     def search(self, *args, **kwargs):
-        import requests
         request = {'action': 'search', 'query': (args, kwargs),
                    'source_id': self._source_id}
-        response = requests.post(
-            url=self.source_url, **self._get_http_args({}),
+        response = self._session.post(
+            url=self.source_url, stream=True, **self._get_http_args({}),
             data=msgpack.packb(request, **pack_kwargs))
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as err:
-            raise RemoteCatalogError("Failed search query.") from err
-        source = msgpack.unpackb(response.content, **unpack_kwargs)
+        _check_status(response, "Failed search query.")
+        source = _unpack(_read_body(response))
         source_id = source['source_id']
         cat = RemoteCatalog(
             url=self.url,
@@ -281,11 +404,37 @@ class RemoteCatalog(Catalog):
         cat.cat = self
         return cat
 
+    def asearch(self, *args, **kwargs):
+        """Run ``search`` in a background thread
+
+        Takes the same arguments as ``search``, but returns a
+        ``concurrent.futures.Future`` of the resulting catalog at once, so that
+        several queries can be in flight together.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._search_workers)
+        return self._executor.submit(self.search, *args, **kwargs)
+
+    def _close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._session.close()
+
+    def __del__(self):
+        # __init__ may have failed before the session and executor were set.
+        if hasattr(self, '_executor'):
+            self._close()
+
     def __len__(self):
+        # The length arrives with the metadata fetched by _load, so normally
+        # this makes no request at all.
         if self._len is None:
             # The server is running an old version of intake and did not
             # provide a length, so we have no choice but to do this the
-            # expensive way.
+            # expensive way. (Such a server would not support any dedicated
+            # length query either.)
             return sum(1 for _ in self)
         else:
             return self._len
@@ -311,7 +460,7 @@ class RemoteCatalog(Catalog):
             out[name]['kwargs'].pop('parameters')
         fn = posixpath.join(path, 'cat.yaml')
         with open_files([fn], 'wt')[0] as f:
-            yaml.dump({'sources': out}, f)
+            yaml.dump({'sources': out}, f, Dumper=FastDumper)
         return YAMLFileCatalog(fn)
 
 
@@ -326,7 +475,8 @@ class Entries(collections.abc.Mapping):
     # internal we should not need the PY2-only iter* variants.
     def __init__(self, catalog):
         self._catalog = catalog
-        self._page_cache = collections.OrderedDict()
+        # Plain dicts preserve insertion order, i.e., the server's order.
+        self._page_cache = {}
         # Put lookups that were due to __getitem__ in a separate cache
         # so that iteration reflects the server's order, not an
         # arbitrary cache order.
@@ -350,19 +500,56 @@ class Entries(collections.abc.Mapping):
             # or the server is a version of intake before pagination parameters
             # were added.
             return
-        # Fetch more entries from the server.
-        while True:
-            page = self._catalog.fetch_page(self._page_offset)
-            self._page_cache.update(page)
-            self._page_offset += len(page)
-            for key in page:
-                yield key
-            if len(page) < self._catalog.page_size:
-                # Partial or empty page.
-                # We are done until the next call to items(), when we
-                # will resume at the offset where we left off.
-                self.complete = True
-                break
+        # Fetch more entries from the server, keeping several page requests
+        # in flight so that their round-trips overlap. Only one is made to
+        # begin with, and more are started once the first key of a page has
+        # been consumed, so that peeking at the first entry (as tab-completion
+        # does) costs a single request.
+        page_size = self._catalog.page_size
+        nprefetch = max(1, self._catalog._prefetch)
+        executor = ThreadPoolExecutor(max_workers=nprefetch)
+        futures = collections.deque([executor.submit(
+            self._catalog.fetch_page, self._page_offset)])
+        next_offset = self._page_offset + page_size
+        inflight = 1
+        try:
+            while True:
+                page = futures.popleft().result()
+                self._page_cache.update(page)
+                self._page_offset += len(page)
+                for i, key in enumerate(page):
+                    yield key
+                    if i == 0 and len(page) == page_size:
+                        # Double the number of requests in flight, up to
+                        # the prefetch limit.
+                        inflight = min(2 * inflight, nprefetch)
+                        while len(futures) < inflight:
+                            futures.append(executor.submit(
+                                self._catalog.fetch_page, next_offset))
+                            next_offset += page_size
+                if len(page) < page_size:
+                    # Partial or empty page.
+                    # We are done until the next call to items(), when we
+                    # will resume at the offset where we left off.
+                    self.complete = True
+                    break
+        except GeneratorExit:
+            # Iteration stopped early: keep any pages that have already
+            # arrived, in order, rather than throwing them away.
+            for future in futures:
+                if not future.done() or future.exception() is not None:
+                    break
+                page = future.result()
+                self._page_cache.update(page)
+                self._page_offset += len(page)
+                if len(page) < page_size:
+                    self.complete = True
+                    break
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def cached_items(self):
         """
@@ -374,15 +561,34 @@ class Entries(collections.abc.Mapping):
             yield item
 
     def __getitem__(self, key):
-        try:
-            return self._direct_lookup_cache[key]
-        except KeyError:
-            try:
-                return self._page_cache[key]
-            except KeyError:
-                source = self._catalog.fetch_by_name(key)
-                self._direct_lookup_cache[key] = source
-                return source
+        # Use sentinel lookups rather than catching KeyError, since misses
+        # are the common case when entries are fetched one by one.
+        source = self._direct_lookup_cache.get(key, _MISSING)
+        if source is not _MISSING:
+            return source
+        source = self._page_cache.get(key, _MISSING)
+        if source is not _MISSING:
+            return source
+        source = self._catalog.fetch_by_name(key)
+        self._direct_lookup_cache[key] = source
+        return source
+
+    def __getitems__(self, keys):
+        """List of the entries for ``keys``, fetching any not cached together"""
+        keys = list(keys)
+        missing = list(dict.fromkeys(
+            key for key in keys
+            if key not in self._direct_lookup_cache
+            and key not in self._page_cache))
+        if len(missing) == 1:
+            self[missing[0]]
+        elif missing:
+            found = self._catalog.fetch_by_names(missing)
+            self._direct_lookup_cache.update(found)
+            for key in missing:
+                if key not in found:
+                    raise KeyError(key)
+        return [self[key] for key in keys]
 
     def __len__(self):
         return len(self._catalog)
@@ -421,11 +627,16 @@ class RemoteCatalogEntry(CatalogEntry):
                                  if (isinstance(up, dict) and 'cls' in up)
                                  else up
                                  for up in user_parameters or []]
+        # Output of client_shell() parameter defaults, filled in by get()
+        self._shell_defaults = {}
         self._direct_access = direct_access
-        self.http_args = (http_args or {}).copy()
-        if 'headers' not in self.http_args:
-            self.http_args['headers'] = {}
-        
+        # Held by reference: entries of one catalog all share its http_args,
+        # so this must not be modified; get() builds a copy per call.
+        self.http_args = http_args if http_args is not None else {}
+        # Shared requests.Session of the parent catalog, if any; assigned
+        # after construction so that it is not part of the serialised state.
+        self._session = None
+
         super(RemoteCatalogEntry, self).__init__(getenv=getenv,
                                                  getshell=getshell)
 
@@ -446,16 +657,26 @@ class RemoteCatalogEntry(CatalogEntry):
 
     def get(self, **user_parameters):
         for par in self._user_parameters:
-            if par['name'] not in user_parameters:
+            name = par['name']
+            if name not in user_parameters:
                 default = par['default']
                 if isinstance(default, str):
-                    default = coerce(par['type'], expand_defaults(
-                        par['default'], True, self.getenv, self.getshell))
-                user_parameters[par['name']] = default
-
-        http_args = self.http_args.copy()
-        http_args['headers'] = self.http_args['headers'].copy()
-        http_args['headers'].update(self.auth.get_headers())
+                    if default.startswith('client_shell('):
+                        # Running the shell command is expensive, so only its
+                        # output is kept; env, "now" etc. are evaluated anew.
+                        if name not in self._shell_defaults:
+                            self._shell_defaults[name] = expand_defaults(
+                                default, True, self.getenv, self.getshell)
+                        default = self._shell_defaults[name]
+                    else:
+                        default = expand_defaults(
+                            default, True, self.getenv, self.getshell)
+                    default = coerce(par['type'], default)
+                user_parameters[name] = default
+
+        http_args = {**self.http_args,
+                     'headers': {**self.http_args.get('headers', {}),
+                                 **self.auth.get_headers()}}
         return open_remote(
             self.url, self.name, container=self.container,
             user_parameters=user_parameters, description=self.description,
@@ -464,14 +685,19 @@ class RemoteCatalogEntry(CatalogEntry):
             auth=self.auth,
             getenv=self.getenv,
             persist_mode=self.catalog_pmode,
-            getshell=self.getshell)
+            getshell=self.getshell,
+            session=self._session)
 
 
 def open_remote(url, entry, container, user_parameters, description, http_args,
-                page_size=None, persist_mode=None, auth=None, getenv=None, getshell=None):
-    """Create either local direct data source or remote streamed source"""
+                page_size=None, persist_mode=None, auth=None, getenv=None, getshell=None,
+                session=None):
+    """Create either local direct data source or remote streamed source
+
+    If given, ``session`` is the ``requests.Session`` used to issue the open
+    request, so that the connection of the calling catalog is reused.
+    """
     from intake.container import container_map
-    import msgpack
     import requests
     from requests.compat import urljoin
 
@@ -480,12 +706,13 @@ def open_remote(url, entry, container, user_parameters, description, http_args,
     payload = dict(action='open',
                    name=entry,
                    parameters=user_parameters,
-                   available_plugins=list(plugin_registry.keys()))
-    req = requests.post(urljoin(url, '/v1/source'),
-                        data=msgpack.packb(payload, **pack_kwargs),
-                        **http_args)
+                   available_plugins=_get_cached_plugin_names())
+    post = requests.post if session is None else session.post
+    req = post(urljoin(url, '/v1/source'),
+               data=msgpack.packb(payload, **pack_kwargs),
+               **http_args)
     if req.ok:
-        response = msgpack.unpackb(req.content, **unpack_kwargs)
+        response = _unpack(req.content)
 
         if 'plugin' in response:
             pl = response['plugin']
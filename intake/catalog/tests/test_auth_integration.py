@@ -83,3 +83,14 @@ def test_secret_auth_fail(intake_server_with_auth):
     auth = SecretClientAuth(secret='test_wrong_secret')
     with pytest.raises(AuthenticationFailure):
         list(open_catalog(intake_server_with_auth, auth=auth))
+
+
+def test_secret_auth_fail_reuses_connection(intake_server_with_auth):
+    auth = SecretClientAuth(secret='test_secret')
+    catalog = open_catalog(intake_server_with_auth, auth=auth)
+    auth.secret = 'test_wrong_secret'
+    for _ in range(3):
+        with pytest.raises(AuthenticationFailure):
+            catalog.force_reload()
+    pools = catalog._session.get_adapter(catalog.info_url).poolmanager.pools
+    assert [pools[key].num_connections for key in pools.keys()] == [1]
@@ -0,0 +1,84 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2018, Anaconda, Inc. and Intake contributors
+# All rights reserved.
+#
+# The full license is in the LICENSE file, distributed with this software.
+#-----------------------------------------------------------------------------
+
+import datetime
+import time
+
+import msgpack
+
+import intake.catalog.remote as remote
+import intake.catalog.utils as utils
+from intake.auth.base import BaseClientAuth
+from intake.compat import pack_kwargs, unpack_kwargs
+from intake.source import register_driver, unregister_driver, registry
+
+
+def test_unpack_matches_msgpack():
+    msg = {'sources': [{'name': 'a', 'args': {'n': 1, 'b': b'x'},
+                        'user_parameters': [
+                            {'default': datetime.datetime(1970, 1, 1)}]}],
+           'metadata': {'when': datetime.datetime(2000, 1, 2, 3, 4, 5)}}
+    data = msgpack.packb(msg, **pack_kwargs)
+    assert remote._unpack(data) == msgpack.unpackb(data, **unpack_kwargs) == msg
+
+
+def _entry(monkeypatch, user_parameters):
+    monkeypatch.setattr(remote, 'open_remote',
+                        lambda *args, **kwargs: kwargs['user_parameters'])
+    return remote.RemoteCatalogEntry(
+        url='http://localhost/', auth=BaseClientAuth(),
+        user_parameters=user_parameters)
+
+
+def test_entry_shell_default_run_once(monkeypatch):
+    calls = []
+
+    def check_output(cmd):
+        calls.append(cmd)
+        return b'out\n'
+
+    monkeypatch.setattr(utils.subprocess, 'check_output', check_output)
+    entry = _entry(monkeypatch, [{'name': 'a', 'default': 'client_shell(cmd)',
+                                  'type': 'str'}])
+    assert entry.get(a='given') == {'a': 'given'}
+    assert entry.get() == {'a': 'out'}
+    assert entry.get() == {'a': 'out'}
+    assert calls == [['cmd']]
+
+
+def test_entry_env_default_per_call(monkeypatch):
+    entry = _entry(monkeypatch, [{'name': 'a', 'default': 'client_env(A)',
+                                  'type': 'str'}])
+    monkeypatch.setenv('A', 'one')
+    assert entry.get() == {'a': 'one'}
+    monkeypatch.setenv('A', 'two')
+    assert entry.get() == {'a': 'two'}
+
+
+def test_entry_now_default_per_call(monkeypatch):
+    entry = _entry(monkeypatch, [{'name': 'a', 'default': 'now',
+                                  'type': 'datetime'}])
+    first = entry.get()['a']
+    time.sleep(0.01)
+    assert entry.get()['a'] > first
+
+
+def test_cached_plugin_names():
+    names = remote._get_cached_plugin_names()
+    assert names == list(registry)
+    assert remote._get_cached_plugin_names() is names
+    register_driver('cached_names_test', object)
+    try:
+        assert 'cached_names_test' in remote._get_cached_plugin_names()
+    finally:
+        unregister_driver('cached_names_test')
+    assert 'cached_names_test' not in remote._get_cached_plugin_names()
+
+
+def test_del_partly_built_catalog():
+    # As when __init__ raised before the session was made.
+    remote.RemoteCatalog.__new__(remote.RemoteCatalog).__del__()
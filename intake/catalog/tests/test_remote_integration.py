@@ -302,6 +302,113 @@ def test_pagination(intake_server):
     assert len(catalog._entries._direct_lookup_cache) == 1
 
 
+def test_pagination_prefetch_order(intake_server):
+    expected = list(open_catalog(intake_server, page_size=None))
+    catalog = open_catalog(intake_server, page_size=1)
+    assert list(catalog) == expected
+    assert catalog._entries.complete
+    assert catalog._entries._page_offset == len(expected)
+
+
+def test_pagination_prefetch_peek(intake_server, monkeypatch):
+    catalog = open_catalog(intake_server, page_size=1)
+    offsets = []
+    fetch_page = catalog.fetch_page
+
+    def record(page_offset):
+        offsets.append(page_offset)
+        return fetch_page(page_offset)
+
+    monkeypatch.setattr(catalog, 'fetch_page', record)
+    next(iter(catalog._entries))
+    assert offsets == [0]
+    assert catalog._entries._page_offset == 1
+    # Pages fetched but not consumed are kept for the next iteration.
+    it = iter(catalog._entries)
+    next(it)
+    next(it)
+    it.close()
+    assert catalog._entries._page_offset == len(
+        catalog._entries._page_cache)
+    assert sorted(offsets) == list(range(len(offsets)))
+
+
+def test_auth_headers_cached(intake_server):
+    from intake.auth.base import BaseClientAuth
+
+    class CountingAuth(BaseClientAuth):
+        calls = 0
+
+        def get_headers(self):
+            CountingAuth.calls += 1
+            return {}
+
+    catalog = open_catalog(intake_server, page_size=1, ttl=100,
+                           auth=CountingAuth())
+    list(catalog)
+    assert CountingAuth.calls == 1
+    catalog.force_reload()
+    assert CountingAuth.calls == 2
+
+
+@pytest.mark.parametrize('batch', [True, False])
+def test_getitems(intake_server, batch):
+    catalog = open_catalog(intake_server, page_size=2)
+    catalog._batch_lookup = batch
+    entries = catalog._entries.__getitems__(['arr', 'text', 'arr'])
+    assert [e.name for e in entries] == ['arr', 'text', 'arr']
+    assert set(catalog._entries._direct_lookup_cache) == {'arr', 'text'}
+    assert entries[0].describe() == catalog['arr'].describe()
+    assert all(e._session is catalog._session for e in entries)
+    with pytest.raises(KeyError):
+        catalog._entries.__getitems__(['entry1', 'doesnotexist'])
+
+
+def test_getitems_old_server(intake_server, monkeypatch):
+    # Send an action the server does not know in place of 'get_many', as a
+    # server from before batch lookup would see it.
+    import msgpack
+    from intake.compat import pack_kwargs, unpack_kwargs
+    catalog = open_catalog(intake_server, page_size=2)
+    post = catalog._session.post
+
+    def old_post(url, data, **kwargs):
+        request = msgpack.unpackb(data, **unpack_kwargs)
+        if request['action'] == 'get_many':
+            request['action'] = 'get_many_unsupported'
+        return post(url=url, data=msgpack.packb(request, **pack_kwargs),
+                    **kwargs)
+
+    monkeypatch.setattr(catalog._session, 'post', old_post)
+    entries = catalog._entries.__getitems__(['arr', 'text'])
+    assert [e.name for e in entries] == ['arr', 'text']
+    assert catalog._batch_lookup is False
+    pools = catalog._session.get_adapter(catalog.source_url).poolmanager.pools
+    assert [pools[key].num_connections for key in pools.keys()] == [1]
+
+
+def test_getitems_dedup(intake_server, monkeypatch):
+    catalog = open_catalog(intake_server, page_size=2)
+    requested = []
+    fetch_by_names = catalog.fetch_by_names
+
+    def record(names):
+        requested.append(names)
+        return fetch_by_names(names)
+
+    monkeypatch.setattr(catalog, 'fetch_by_names', record)
+    catalog._entries.__getitems__(['arr', 'text', 'arr', 'text'])
+    assert requested == [['arr', 'text']]
+
+
+def test_missing_entries_reuse_connection(intake_server):
+    catalog = open_catalog(intake_server)
+    for _ in range(5):
+        assert 'doesnotexist' not in catalog
+    pools = catalog._session.get_adapter(catalog.source_url).poolmanager.pools
+    assert [pools[key].num_connections for key in pools.keys()] == [1]
+
+
 def test_dir(intake_server):
     PAGE_SIZE = 2
     catalog = open_catalog(intake_server, page_size=PAGE_SIZE)
@@ -416,6 +523,17 @@ def test_search(intake_server):
     assert list(local_results) == list(remote_results) == expected
 
 
+def test_asearch(intake_server):
+    remote_catalog = open_catalog(intake_server)
+    futures = [remote_catalog.asearch('entry1'),
+               remote_catalog.asearch('DOES NOT EXIST')]
+    results = [future.result() for future in futures]
+    assert all(isinstance(cat, RemoteCatalog) for cat in results)
+    assert list(results[0]) == list(remote_catalog.search('entry1'))
+    assert list(results[1]) == []
+    remote_catalog.close()
+
+
 def test_access_subcatalog(intake_server):
     catalog = open_catalog(intake_server)
     catalog['nested']
@@ -433,3 +551,10 @@ def test_datetime(intake_server):
     catalog['datetime'].parameters['time'] == pd.Timestamp("1970")
 
 
+def test_session_and_http_args_shared(intake_server):
+    catalog = open_catalog(intake_server, page_size=2)
+    entries = [catalog._entries[name] for name in list(catalog)]
+    entries.append(catalog._entries['arr'])
+    assert all(entry._session is catalog._session for entry in entries)
+    assert all(entry.http_args is catalog.http_args for entry in entries)
+    catalog.close()
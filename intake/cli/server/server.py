@@ -4,6 +4,7 @@
 #
 # The full license is in the LICENSE file, distributed with this software.
 #-----------------------------------------------------------------------------
+import gzip
 import time
 from uuid import uuid4
 
@@ -21,6 +22,11 @@ from intake import __version__
 from intake.compat import unpack_kwargs, pack_kwargs
 logger = logging.getLogger('intake')
 
+# Catalog listings at least this long (in bytes) are gzipped for clients
+# that accept it; as in tornado's own GZipContentEncoding.
+GZIP_MIN_LENGTH = 1024
+GZIP_LEVEL = 6
+
 
 class IntakeServer(object):
     """Main intake-server tornado application"""
@@ -129,7 +135,17 @@ class ServerInfoHandler(tornado.web.RequestHandler):
             msg = 'Access forbidden'
             raise tornado.web.HTTPError(status_code=403, log_message=msg,
                                         reason=msg)
-        self.write(msgpack.packb(server_info, **pack_kwargs))
+        out = msgpack.packb(server_info, **pack_kwargs)
+        # Listings are highly redundant (repeated keys, drivers, paths), so
+        # compress them; requests decompresses transparently.
+        if len(out) >= GZIP_MIN_LENGTH:
+            # Whether or not it is compressed, the response now depends on
+            # the request's Accept-Encoding, which caches must know.
+            self.add_header('Vary', 'Accept-Encoding')
+            if 'gzip' in head.get('Accept-Encoding', ''):
+                self.set_header('Content-Encoding', 'gzip')
+                out = gzip.compress(out, compresslevel=GZIP_LEVEL)
+        self.write(out)
 
 
 class SourceCache(object):
@@ -179,9 +195,10 @@ class SourceCache(object):
 class ServerSourceHandler(tornado.web.RequestHandler):
     """Open or stream data source
 
-    The requests "action" field (open|read) specified what the request wants
-    to do. Open caches the source and created an ID for it, read uses that
-    ID to reference the source and read a partition.
+    The requests "action" field (open|read|search|get_many) specified what the
+    request wants to do. Open caches the source and created an ID for it, read
+    uses that ID to reference the source and read a partition. get_many
+    describes several sources by name in one go.
     """
     def initialize(self, catalog, cache, auth):
         self._catalog = catalog
@@ -210,22 +227,13 @@ class ServerSourceHandler(tornado.web.RequestHandler):
                 raise tornado.web.HTTPError(status_code=404, log_message=msg,
                                             reason=msg)
             if self.auth.allow_access(head, source, self._catalog):
-                info = source.describe().copy()
-                info['name'] = name
-
-                source_info = dict(source=info)
+                info = self._source_info(name, source)
                 try:
-                    out = msgpack.packb(source_info, **pack_kwargs)
+                    out = msgpack.packb(dict(source=info), **pack_kwargs)
                 except TypeError:
-                    info['direct_access'] = 'forbid'
-                    modified_args = source_info['source']['args'].copy()
-                    for k, v in source_info['source']['args'].items():
-                        try:
-                            msgpack.packb(v, **pack_kwargs)
-                        except TypeError:
-                            modified_args[k] = 'UNSERIALIZABLE_VALUE'
-                    source_info['source']['args'] = modified_args
-                    out = msgpack.packb(source_info, **pack_kwargs)
+                    out = msgpack.packb(
+                        dict(source=self._serializable_info(info)),
+                        **pack_kwargs)
                 self.write(out)
                 return
 
@@ -233,6 +241,33 @@ class ServerSourceHandler(tornado.web.RequestHandler):
         raise tornado.web.HTTPError(status_code=403, log_message=msg,
                                     reason=msg)
 
+    @staticmethod
+    def _source_info(name, source):
+        """Description of one source, as sent to the client"""
+        info = source.describe().copy()
+        info['name'] = name
+        return info
+
+    @staticmethod
+    def _serializable_info(info):
+        """Source description with unserializable args replaced
+
+        Only needed once packing the description has failed, so that the
+        usual case costs a single packing of the response.
+        """
+        try:
+            msgpack.packb(info, **pack_kwargs)
+        except TypeError:
+            info['direct_access'] = 'forbid'
+            modified_args = info['args'].copy()
+            for k, v in info['args'].items():
+                try:
+                    msgpack.packb(v, **pack_kwargs)
+                except TypeError:
+                    modified_args[k] = 'UNSERIALIZABLE_VALUE'
+            info['args'] = modified_args
+        return info
+
     @tornado.gen.coroutine
     def post(self):
         request = msgpack.unpackb(self.request.body, **unpack_kwargs)
@@ -267,6 +302,35 @@ class ServerSourceHandler(tornado.web.RequestHandler):
             response = {'source_id': query_source_id}
             self.write(msgpack.packb(response, **pack_kwargs))
             self.finish()
+        elif action == 'get_many':
+            # Like GET, for several names at once; names not in the catalog
+            # are left out of the response.
+            if not self.auth.allow_connect(head):
+                msg = 'Access forbidden'
+                raise tornado.web.HTTPError(status_code=403, log_message=msg,
+                                            reason=msg)
+            if 'source-id' in head:
+                cat = self._cache.get(head['source-id'])
+            else:
+                cat = self._catalog
+            sources = []
+            for name in request['names']:
+                try:
+                    source = cat[name]
+                except KeyError:
+                    continue
+                if not self.auth.allow_access(head, source, self._catalog):
+                    msg = 'Access forbidden'
+                    raise tornado.web.HTTPError(status_code=403,
+                                                log_message=msg, reason=msg)
+                sources.append(self._source_info(name, source))
+            try:
+                out = msgpack.packb(dict(sources=sources), **pack_kwargs)
+            except TypeError:
+                sources = [self._serializable_info(info) for info in sources]
+                out = msgpack.packb(dict(sources=sources), **pack_kwargs)
+            self.write(out)
+            self.finish()
         elif action == 'open':
             if 'source-id' in head:
                 cat = self._cache.get(head['source-id'])
@@ -13,6 +13,7 @@ import requests
 import shutil
 import subprocess
 import time
+from unittest import mock
 
 from tornado.ioloop import IOLoop
 from tornado.testing import AsyncHTTPTestCase
@@ -20,7 +21,7 @@ import msgpack
 
 from intake import open_catalog
 from intake.container.serializer import MsgPackSerializer, GzipCompressor
-from intake.cli.server.server import IntakeServer
+from intake.cli.server.server import IntakeServer, ServerSourceHandler
 from intake.compat import unpack_kwargs, pack_kwargs
 from intake.utils import make_path_posix
 
@@ -86,6 +87,22 @@ class TestServerV1Info(TestServerV1Base):
             for k in right:
                 assert left[k] == right[k]
 
+    @mock.patch('intake.cli.server.server.GZIP_MIN_LENGTH', 0)
+    def test_info_gzip(self):
+        import gzip
+        plain = self.fetch('/v1/info', decompress_response=False)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertEqual(plain.headers['Vary'], 'Accept-Encoding')
+
+        response = self.fetch('/v1/info', decompress_response=False,
+                              headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertLess(len(response.body), len(plain.body))
+        self.assertEqual(self.decode(gzip.decompress(response.body)),
+                         self.decode(plain.body))
+
 
 class TestServerV1Source(TestServerV1Base):
     def make_post_request(self, msg, expected_status=200):
@@ -123,6 +140,23 @@ class TestServerV1Source(TestServerV1Base):
 
         self.assertTrue(isinstance(resp_msg['source_id'], str))
 
+    def test_get_many(self):
+        msg = dict(action='get_many', names=['entry1', 'nonexistent',
+                                             'entry1_part'])
+        resp_msg, = self.make_post_request(msg)
+
+        self.assertEqual([s['name'] for s in resp_msg['sources']],
+                         ['entry1', 'entry1_part'])
+        single = self.decode(self.fetch('/v1/source?name=entry1').body)
+        self.assertEqual(resp_msg['sources'][0], single['source'])
+
+    def test_serializable_info(self):
+        info = dict(name='a', direct_access='allow',
+                    args=dict(ok=1, bad=object()))
+        info = ServerSourceHandler._serializable_info(info)
+        self.assertEqual(info['direct_access'], 'forbid')
+        self.assertEqual(info['args'], dict(ok=1, bad='UNSERIALIZABLE_VALUE'))
+
     def test_open_direct(self):
         msg = dict(action='open', name='entry1_part', parameters=dict(part='2'),
                    available_plugins=['csv'])
@@ -19,13 +19,56 @@ class DriverRegistry(dict):
 
     If the value object is a EntryPoint, will load it when accesses, which
     does the import.
+
+    ``version`` is incremented whenever a name is added or removed, so that
+    derived data (such as the list of names) can be cached.
     """
 
+    # A class attribute, so that it is already there when unpickling puts the
+    # items back through __setitem__.
+    version = 0
+
     def __getitem__(self, item):
         if isinstance(super().__getitem__(item), entrypoints.EntryPoint):
             self[item] = super().__getitem__(item).load()
         return super().__getitem__(item)
 
+    def __setitem__(self, key, value):
+        if key not in self:
+            self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, key, *args):
+        if key in self:
+            self.version += 1
+        return super().pop(key, *args)
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        # Only adds or replaces items, so the names change if the length does.
+        size = len(self)
+        super().update(*args, **kwargs)
+        if len(self) != size:
+            self.version += 1
+
+    def clear(self):
+        if self:
+            self.version += 1
+        super().clear()
+
 
 _registry = DriverRegistry()  # internal mutable registry
 registry = DriverRegistryView(_registry)  # public, read-ony wrapper
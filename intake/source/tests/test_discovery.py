@@ -7,6 +7,7 @@
 
 import os
 import os.path
+import pickle
 import shlex
 import subprocess
 import sys
@@ -154,3 +155,31 @@ def test_discover_pluginprefix(extra_pythonpath, tmp_config_path):
 def test_discover_collision(extra_pythonpath, tmp_config_path):
     with pytest.warns(UserWarning):
         discovery.autodiscover(plugin_prefix='collision_', do_package_scan=True)
+
+
+def test_registry_version():
+    from intake.source import DriverRegistry, registry
+    reg = DriverRegistry()
+    versions = [reg.version]
+    reg['a'] = 1
+    versions.append(reg.version)
+    reg['a'] = 2  # replacing a value does not change the names
+    assert reg.version == versions[-1]
+    reg.update(b=1)
+    versions.append(reg.version)
+    reg.pop('b')
+    versions.append(reg.version)
+    del reg['a']
+    versions.append(reg.version)
+    assert versions == sorted(set(versions))
+    reg.update(c=1)
+    versions.append(reg.version)
+    # No name changes, so no new version
+    reg.pop('missing', None)
+    reg.update(c=2)
+    assert reg.version == versions[-1]
+
+    reg2 = pickle.loads(pickle.dumps(reg))
+    assert reg2 == reg
+    assert reg2.version == reg.version
+    pickle.loads(pickle.dumps(registry))
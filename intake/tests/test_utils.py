@@ -49,6 +49,14 @@ def test_yaml_tuples():
     with no_duplicate_yaml():
         assert yaml.safe_load(text) == data
 
+def test_fast_dumper_matches_default():
+    from collections import OrderedDict
+    from intake.utils import FastDumper
+    data = {'sources': OrderedDict([('b', {'args': (1, 2)}),
+                                    ('a', OrderedDict(x=[1, None]))])}
+    assert yaml.dump(data, Dumper=FastDumper) == yaml.dump(data)
+
+
 def copy_test_file(filename, target_dir):
     if not os.path.exists(target_dir):
         os.makedirs(target_dir)  # can't use exist_ok in Python 2.7
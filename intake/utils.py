@@ -53,7 +53,15 @@ def represent_dictionary_order(self, dict_data):
     return self.represent_mapping('tag:yaml.org,2002:map', dict_data.items())
 
 
+try:
+    # libyaml-backed, much faster for large outputs such as whole catalogs
+    from yaml import CDumper as FastDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import Dumper as FastDumper
+
 yaml.add_representer(OrderedDict, represent_dictionary_order)
+yaml.add_representer(OrderedDict, represent_dictionary_order,
+                     Dumper=FastDumper)
 
 
 @contextmanager
@@ -18,7 +18,7 @@ extras_require = {
   'server': ['tornado', 'python-snappy', 'msgpack-python'],
   'plot': ['hvplot', 'panel >= 0.7.0', 'bokeh'],
   'dataframe': ['dask[dataframe]', 'msgpack-numpy', 'pyarrow'],
-  'remote': ['requests']
+  'remote': ['requests', 'msgspec; python_version >= "3.8"']
 }
 extras_require['complete'] = sorted(set(sum(extras_require.values(), [])))
 